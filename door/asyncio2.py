@@ -1,8 +1,8 @@
 """:mod:`door.asyncio2` defines utilities for asynchronous programming."""
 
-from asyncio import Condition, Lock
+from asyncio import Condition, Lock, set_event_loop_policy
 from dataclasses import dataclass, field
-from typing import TypeVar
+from typing import ClassVar, TYPE_CHECKING, TypeVar
 
 from door.doors import (
     AsyncAcquirableDoor,
@@ -13,6 +13,7 @@ from door.doors import (
 )
 from door.primitives import (
     Acquirable,
+    AsyncPFLock,
     AsyncRSLock,
     AsyncSCondition,
     AsyncWSLock,
@@ -25,8 +26,28 @@ from door.utilities import IntCounter
 _T = TypeVar('_T')
 
 
+class _LazyCounters:
+    _lazy_counters: ClassVar[tuple[str, ...]] = ()
+
+    if not TYPE_CHECKING:
+        def __getattr__(self, name: str) -> IntCounter:
+            if name not in self._lazy_counters:
+                raise AttributeError(
+                    (
+                        f'{type(self).__name__!r} object has no attribute'
+                        f' {name!r}'
+                    ),
+                )
+
+            counter = IntCounter()
+
+            setattr(self, name, counter)
+
+            return counter
+
+
 @dataclass
-class RSLock(AsyncRSLock):
+class RSLock(_LazyCounters, AsyncRSLock):
     """The class for asynchronous read-preferring shared locks.
 
     This class is designed to be used for asynchronous programming.
@@ -34,29 +55,59 @@ class RSLock(AsyncRSLock):
     The implementations in this library is read-preferring and follow
     the pseudocode in Concurrent Programming: Algorithms, Principles,
     and Foundations by Michel Raynal.
+
+    The reader counter is only allocated when it is first used.
     """
 
     _r: Acquirable = field(default_factory=Lock)
     _g: Acquirable = field(default_factory=Lock)
-    _b: IntCounter = field(default_factory=IntCounter, init=False)
+    _b: IntCounter = field(init=False)
+    _lazy_counters: ClassVar[tuple[str, ...]] = ('_b',)
 
 
 @dataclass
-class WSLock(AsyncWSLock):
+class WSLock(_LazyCounters, AsyncWSLock):
     """The class for asynchronous write-preferring shared locks.
 
     This class is designed to be used for asynchronous programming.
+
+    The counters are only allocated when they are first used.
     """
 
     _g: Waitable = field(default_factory=Condition)
-    _num_writers_waiting: IntCounter = field(
-        default_factory=IntCounter,
-        init=False,
+    _num_writers_waiting: IntCounter = field(init=False)
+    _writer_active: IntCounter = field(init=False)
+    _num_readers_active: IntCounter = field(init=False)
+    _num_readers_waiting: IntCounter = field(init=False)
+    _lazy_counters: ClassVar[tuple[str, ...]] = (
+        '_num_writers_waiting',
+        '_writer_active',
+        '_num_readers_active',
+        '_num_readers_waiting',
     )
-    _writer_active: IntCounter = field(default_factory=IntCounter, init=False)
-    _num_readers_active: IntCounter = field(
-        default_factory=IntCounter,
-        init=False,
+
+
+@dataclass
+class PFLock(_LazyCounters, AsyncPFLock):
+    """The class for asynchronous phase-fair shared locks.
+
+    This class is designed to be used for asynchronous programming.
+
+    The counters are only allocated when they are first used.
+    """
+
+    _g: Waitable = field(default_factory=Condition)
+    _num_readers_active: IntCounter = field(init=False)
+    _num_readers_waiting: IntCounter = field(init=False)
+    _num_writers_waiting: IntCounter = field(init=False)
+    _writer_active: IntCounter = field(init=False)
+    _phase: IntCounter = field(init=False)
+    _lazy_counters: ClassVar[tuple[str, ...]] = (
+        '_num_readers_active',
+        '_num_readers_waiting',
+        '_num_writers_waiting',
+        '_writer_active',
+        '_phase',
     )
 
 
@@ -133,7 +184,7 @@ class SAcquirableDoor(UnhandledDoor[_T], AsyncSAcquirableDoor[_T]):
     raised.
     """
 
-    _primitive: SAcquirable = field(default_factory=WSLock)
+    _primitive: SAcquirable = field(default_factory=PFLock)
 
 
 @dataclass
@@ -152,3 +203,23 @@ class SWaitableDoor(UnhandledDoor[_T], AsyncSWaitableDoor[_T]):
     """
 
     _primitive: SWaitable = field(default_factory=WSCondition)
+
+
+def install_uvloop() -> None:
+    """Install ``uvloop`` as the event loop policy.
+
+    The primitives and doors in this module are unchanged, but every
+    acquire, release, wait, and notify is scheduled by the faster
+    ``uvloop`` event loop afterwards.
+
+    ``uvloop`` is an optional dependency (``pip install door[fast]``).
+
+    Event loop policies are deprecated from Python 3.14 onwards. On
+    such versions, prefer running the entry point with
+    ``uvloop.run(main())`` instead of calling this function.
+
+    :return: ``None``.
+    """
+    import uvloop  # type: ignore[import-not-found]
+
+    set_event_loop_policy(uvloop.EventLoopPolicy())
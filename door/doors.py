@@ -1,15 +1,21 @@
 """:mod:`door.doors` defines the doors."""
 
 from abc import ABC
-from collections.abc import AsyncIterator, Iterator
-from contextlib import asynccontextmanager, closing, contextmanager
-from dataclasses import dataclass, field
-from typing import cast, Generic, TypeVar
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from dataclasses import dataclass, field, fields
+from typing import Any, Generic, TypeVar
 
 from door.primitives import Acquirable, SAcquirable, SWaitable, Waitable
-from door.utilities import await_if_awaitable, Handle, Proxy
+from door.utilities import asyncify, Handle, Proxy
 
 _T = TypeVar('_T')
+_READ = Proxy.Mode.READ
+_READ_WRITE = Proxy.Mode.READ | Proxy.Mode.WRITE
+
+
+class WouldBlock(ValueError):
+    """The exception for acquisitions that would block."""
 
 
 @dataclass
@@ -22,9 +28,26 @@ class Door(Generic[_T], ABC):
 
     _resource_or_handle: _T | Handle[_T]
 
+    def __post_init__(self) -> None:
+        pass
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.init
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__post_init__()
+
     def _setup(self, mode: Proxy.Mode) -> Proxy[_T]:
         return Proxy(self._resource_or_handle, mode)
 
+    def _handle_name(self) -> str:
+        return ''
+
     def _close(self) -> None:
         pass
 
@@ -32,6 +55,102 @@ class Door(Generic[_T], ABC):
         pass
 
 
+@dataclass(slots=True)
+class _Context(Generic[_T]):
+    _door: Door[_T]
+    _acquire: Callable[[], Any]
+    _release: Callable[[], Any]
+    _mode: Proxy.Mode
+    _proxy: Proxy[_T] = field(init=False)
+
+    def __enter__(self) -> _T:
+        self._acquire()
+
+        try:
+            self._proxy = self._door._setup(self._mode)
+        except BaseException:
+            self._release()
+
+            raise
+
+        return self._proxy  # type: ignore[return-value]
+
+    def __exit__(self, *args: object) -> None:
+        try:
+            self._proxy.close()
+        finally:
+            self._release()
+
+
+@dataclass(slots=True)
+class _AsyncContext(Generic[_T]):
+    _door: Door[_T]
+    _acquire: Callable[[], Awaitable[None]]
+    _release: Callable[[], Awaitable[None]]
+    _mode: Proxy.Mode
+    _proxy: Proxy[_T] = field(init=False)
+
+    async def __aenter__(self) -> _T:
+        await self._acquire()
+
+        try:
+            self._proxy = self._door._setup(self._mode)
+        except BaseException:
+            await self._release()
+
+            raise
+
+        return self._proxy  # type: ignore[return-value]
+
+    async def __aexit__(self, *args: object) -> None:
+        try:
+            self._proxy.close()
+        finally:
+            await self._release()
+
+
+@dataclass(slots=True)
+class _ManyContext:
+    _doors: tuple['AcquirableDoor[Any]', ...]
+    _acquired: list['AcquirableDoor[Any]'] = field(init=False)
+    _proxies: list[Proxy[Any]] = field(init=False)
+
+    def __enter__(self) -> tuple[Any, ...]:
+        primitives: dict[int, AcquirableDoor[Any]] = {}
+
+        for door in sorted(self._doors, key=_many_key):
+            primitives.setdefault(id(door._primitive), door)
+
+        self._acquired = []
+        self._proxies = []
+
+        try:
+            for door in primitives.values():
+                door._acquire()
+                self._acquired.append(door)
+
+            for door in self._doors:
+                self._proxies.append(door._setup(_READ_WRITE))
+        except BaseException:
+            self.__exit__()
+
+            raise
+
+        return tuple(self._proxies)
+
+    def __exit__(self, *args: object) -> None:
+        try:
+            for proxy in self._proxies:
+                proxy.close()
+        finally:
+            for door in reversed(self._acquired):
+                door._release()
+
+
+def _many_key(door: 'AcquirableDoor[Any]') -> tuple[str, int]:
+    return door._handle_name(), id(door._primitive)
+
+
 @dataclass
 class AcquirableDoor(Door[_T]):
     """The class for acquirable doors.
@@ -82,9 +201,24 @@ class AcquirableDoor(Door[_T]):
     """
 
     _primitive: Acquirable
+    _acquire: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _release: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        self._acquire = self._primitive.acquire
+        self._release = self._primitive.release
 
-    @contextmanager
-    def __call__(self) -> Iterator[_T]:
+    def __call__(self) -> AbstractContextManager[_T]:
         """Return the context manager for the resource.
 
         After the resource is released, the resource becomes
@@ -92,15 +226,56 @@ class AcquirableDoor(Door[_T]):
 
         :return: The context manager for the resource.
         """
-        self._primitive.acquire()
+        return _Context(
+            self,
+            self._acquire,
+            self._release,
+            _READ_WRITE,
+        )
+
+    def try_acquire(self) -> AbstractContextManager[_T]:
+        """Return the context manager for the resource without
+        blocking.
+
+        Entering the context manager raises :class:`WouldBlock` if
+        the primitive cannot be acquired immediately, instead of
+        waiting for it.  The primitive's ``acquire`` must accept the
+        ``blocking`` argument as the primitives in :mod:`threading` and
+        :mod:`multiprocessing` do, otherwise entering raises
+        :class:`TypeError`.  After the resource is released, the
+        resource becomes inaccessible.
 
-        try:
-            proxy = self._setup(Proxy.Mode.READ | Proxy.Mode.WRITE)
+        :return: The context manager for the resource.
+        """
+        return _Context(self, self._try_acquire, self._release, _READ_WRITE)
+
+    @staticmethod
+    def acquire_many(
+            *doors: 'AcquirableDoor[Any]',
+    ) -> AbstractContextManager[tuple[Any, ...]]:
+        """Return the context manager for the resources of all doors.
+
+        The primitives are acquired in a fixed global order, so that
+        threads acquiring overlapping sets of doors cannot deadlock.
+        For multiprocessing, the order follows the names of the doors'
+        handles, which are the same in every process, so processes
+        cannot deadlock either as long as doors sharing a primitive
+        are always acquired together.  The proxies are given in the
+        order of the doors.  After the resources are released, the
+        resources become inaccessible.
+
+        :param doors: The doors.
+        :raises ValueError: If two doors share a resource or handle.
+        :return: The context manager for the resources.
+        """
+        if len({id(door._resource_or_handle) for door in doors}) < len(doors):
+            raise ValueError('duplicate resources')
 
-            with closing(proxy):
-                yield cast(_T, proxy)
-        finally:
-            self._primitive.release()
+        return _ManyContext(doors)
+
+    def _try_acquire(self) -> None:
+        if not self._primitive.acquire(False):  # type: ignore[call-arg]
+            raise WouldBlock('would block')
 
 
 @dataclass
@@ -119,9 +294,24 @@ class AsyncAcquirableDoor(Door[_T]):
     """
 
     _primitive: Acquirable
+    _acquire: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _release: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
-    @asynccontextmanager
-    async def __call__(self) -> AsyncIterator[_T]:
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        self._acquire = asyncify(self._primitive.acquire)
+        self._release = asyncify(self._primitive.release)
+
+    def __call__(self) -> AbstractAsyncContextManager[_T]:
         """Return the asynchronous context manager for the resource.
 
         After the resource is released, the resource becomes
@@ -129,15 +319,12 @@ class AsyncAcquirableDoor(Door[_T]):
 
         :return: The context manager for the resource.
         """
-        await await_if_awaitable(self._primitive.acquire())
-
-        try:
-            proxy = self._setup(Proxy.Mode.READ | Proxy.Mode.WRITE)
-
-            with closing(proxy):
-                yield cast(_T, proxy)
-        finally:
-            await await_if_awaitable(self._primitive.release())
+        return _AsyncContext(
+            self,
+            self._acquire,
+            self._release,
+            _READ_WRITE,
+        )
 
 
 @dataclass
@@ -156,6 +343,28 @@ class WaitableDoor(AcquirableDoor[_T]):
     """
 
     _primitive: Waitable
+    _wait: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify_all: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        self._wait = self._primitive.wait
+        self._notify = self._primitive.notify
+        self._notify_all = self._primitive.notify_all
 
     def wait(self) -> None:
         """Wait.
@@ -163,7 +372,7 @@ class WaitableDoor(AcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        self._primitive.wait()
+        self._wait()
         self._open()
 
     def notify(self) -> None:
@@ -172,7 +381,7 @@ class WaitableDoor(AcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        self._primitive.notify()
+        self._notify()
         self._open()
 
     def notify_all(self) -> None:
@@ -181,7 +390,7 @@ class WaitableDoor(AcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        self._primitive.notify_all()
+        self._notify_all()
         self._open()
 
 
@@ -201,6 +410,28 @@ class AsyncWaitableDoor(AsyncAcquirableDoor[_T]):
     """
 
     _primitive: Waitable
+    _wait: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify_all: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        self._wait = asyncify(self._primitive.wait)
+        self._notify = asyncify(self._primitive.notify)
+        self._notify_all = asyncify(self._primitive.notify_all)
 
     async def wait(self) -> None:
         """Wait.
@@ -208,7 +439,7 @@ class AsyncWaitableDoor(AsyncAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        await await_if_awaitable(self._primitive.wait())
+        await self._wait()
         self._open()
 
     async def notify(self) -> None:
@@ -217,7 +448,7 @@ class AsyncWaitableDoor(AsyncAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        await await_if_awaitable(self._primitive.notify())
+        await self._notify()
         self._open()
 
     async def notify_all(self) -> None:
@@ -226,7 +457,7 @@ class AsyncWaitableDoor(AsyncAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        await await_if_awaitable(self._primitive.notify_all())
+        await self._notify_all()
         self._open()
 
 
@@ -292,9 +523,36 @@ class SAcquirableDoor(Door[_T]):
     """
 
     _primitive: SAcquirable
+    _acquire_read: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _release_read: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _acquire_write: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _release_write: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
-    @contextmanager
-    def read(self) -> Iterator[_T]:
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        self._acquire_read = self._primitive.acquire_read
+        self._release_read = self._primitive.release_read
+        self._acquire_write = self._primitive.acquire_write
+        self._release_write = self._primitive.release_write
+
+    def read(self) -> AbstractContextManager[_T]:
         """Return the context manager for the resource in read mode.
 
         After the resource is released, the resource becomes
@@ -302,18 +560,14 @@ class SAcquirableDoor(Door[_T]):
 
         :return: The context manager for the resource.
         """
-        self._primitive.acquire_read()
-
-        try:
-            proxy = self._setup(Proxy.Mode.READ)
-
-            with closing(proxy):
-                yield cast(_T, proxy)
-        finally:
-            self._primitive.release_read()
-
-    @contextmanager
-    def write(self) -> Iterator[_T]:
+        return _Context(
+            self,
+            self._acquire_read,
+            self._release_read,
+            _READ,
+        )
+
+    def write(self) -> AbstractContextManager[_T]:
         """Return the context manager for the resource in write (and
         read) mode.
 
@@ -322,15 +576,64 @@ class SAcquirableDoor(Door[_T]):
 
         :return: The context manager for the resource.
         """
-        self._primitive.acquire_write()
+        return _Context(
+            self,
+            self._acquire_write,
+            self._release_write,
+            _READ_WRITE,
+        )
+
+    def try_read(self) -> AbstractContextManager[_T]:
+        """Return the context manager for the resource in read mode
+        without blocking.
+
+        Entering the context manager raises :class:`WouldBlock` if
+        the primitive cannot be acquired immediately.  The primitive
+        must offer ``try_acquire_read`` as the write-preferring and
+        phase-fair shared locks do, otherwise entering raises
+        :class:`AttributeError`.  After the resource is released, the
+        resource becomes inaccessible.
 
-        try:
-            proxy = self._setup(Proxy.Mode.READ | Proxy.Mode.WRITE)
+        :return: The context manager for the resource.
+        """
+        return _Context(
+            self,
+            self._try_acquire_read,
+            self._release_read,
+            _READ,
+        )
+
+    def try_write(self) -> AbstractContextManager[_T]:
+        """Return the context manager for the resource in write (and
+        read) mode without blocking.
 
-            with closing(proxy):
-                yield cast(_T, proxy)
-        finally:
-            self._primitive.release_write()
+        Entering the context manager raises :class:`WouldBlock` if
+        the primitive cannot be acquired immediately.  The primitive
+        must offer ``try_acquire_write`` as the write-preferring and
+        phase-fair shared locks do, otherwise entering raises
+        :class:`AttributeError`.  After the resource is released, the
+        resource becomes inaccessible.
+
+        :return: The context manager for the resource.
+        """
+        return _Context(
+            self,
+            self._try_acquire_write,
+            self._release_write,
+            _READ_WRITE,
+        )
+
+    def _try_acquire_read(self) -> None:
+        primitive: Any = self._primitive
+
+        if not primitive.try_acquire_read():
+            raise WouldBlock('would block')
+
+    def _try_acquire_write(self) -> None:
+        primitive: Any = self._primitive
+
+        if not primitive.try_acquire_write():
+            raise WouldBlock('would block')
 
 
 @dataclass
@@ -349,9 +652,36 @@ class AsyncSAcquirableDoor(Door[_T]):
     """
 
     _primitive: SAcquirable
+    _acquire_read: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _release_read: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _acquire_write: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _release_write: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        self._acquire_read = asyncify(self._primitive.acquire_read)
+        self._release_read = asyncify(self._primitive.release_read)
+        self._acquire_write = asyncify(self._primitive.acquire_write)
+        self._release_write = asyncify(self._primitive.release_write)
 
-    @asynccontextmanager
-    async def read(self) -> AsyncIterator[_T]:
+    def read(self) -> AbstractAsyncContextManager[_T]:
         """Return the asynchronous context manager for the resource in
         read mode.
 
@@ -360,18 +690,14 @@ class AsyncSAcquirableDoor(Door[_T]):
 
         :return: The context manager for the resource.
         """
-        await await_if_awaitable(self._primitive.acquire_read())
-
-        try:
-            proxy = self._setup(Proxy.Mode.READ)
-
-            with closing(proxy):
-                yield cast(_T, proxy)
-        finally:
-            await await_if_awaitable(self._primitive.release_read())
-
-    @asynccontextmanager
-    async def write(self) -> AsyncIterator[_T]:
+        return _AsyncContext(
+            self,
+            self._acquire_read,
+            self._release_read,
+            _READ,
+        )
+
+    def write(self) -> AbstractAsyncContextManager[_T]:
         """Return the asynchronous context manager for the resource in
         write (and read) mode.
 
@@ -380,15 +706,12 @@ class AsyncSAcquirableDoor(Door[_T]):
 
         :return: The context manager for the resource.
         """
-        await await_if_awaitable(self._primitive.acquire_write())
-
-        try:
-            proxy = self._setup(Proxy.Mode.READ | Proxy.Mode.WRITE)
-
-            with closing(proxy):
-                yield cast(_T, proxy)
-        finally:
-            await await_if_awaitable(self._primitive.release_write())
+        return _AsyncContext(
+            self,
+            self._acquire_write,
+            self._release_write,
+            _READ_WRITE,
+        )
 
 
 @dataclass
@@ -407,6 +730,46 @@ class SWaitableDoor(SAcquirableDoor[_T]):
     """
 
     _primitive: SWaitable
+    _wait_read: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify_read: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify_all_read: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _wait_write: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify_write: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify_all_write: Callable[[], Any] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        self._wait_read = self._primitive.wait_read
+        self._notify_read = self._primitive.notify_read
+        self._notify_all_read = self._primitive.notify_all_read
+        self._wait_write = self._primitive.wait_write
+        self._notify_write = self._primitive.notify_write
+        self._notify_all_write = self._primitive.notify_all_write
 
     def wait_read(self) -> None:
         """Wait for reading.
@@ -414,7 +777,7 @@ class SWaitableDoor(SAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        self._primitive.wait_read()
+        self._wait_read()
         self._open()
 
     def notify_read(self) -> None:
@@ -423,7 +786,7 @@ class SWaitableDoor(SAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        self._primitive.notify_read()
+        self._notify_read()
         self._open()
 
     def notify_all_read(self) -> None:
@@ -432,7 +795,7 @@ class SWaitableDoor(SAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        self._primitive.notify_all_read()
+        self._notify_all_read()
         self._open()
 
     def wait_write(self) -> None:
@@ -441,7 +804,7 @@ class SWaitableDoor(SAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        self._primitive.wait_write()
+        self._wait_write()
         self._open()
 
     def notify_write(self) -> None:
@@ -450,7 +813,7 @@ class SWaitableDoor(SAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        self._primitive.notify_write()
+        self._notify_write()
         self._open()
 
     def notify_all_write(self) -> None:
@@ -459,7 +822,7 @@ class SWaitableDoor(SAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        self._primitive.notify_all_write()
+        self._notify_all_write()
         self._open()
 
 
@@ -479,6 +842,46 @@ class AsyncSWaitableDoor(AsyncSAcquirableDoor[_T]):
     """
 
     _primitive: SWaitable
+    _wait_read: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify_read: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify_all_read: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _wait_write: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify_write: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _notify_all_write: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        self._wait_read = asyncify(self._primitive.wait_read)
+        self._notify_read = asyncify(self._primitive.notify_read)
+        self._notify_all_read = asyncify(self._primitive.notify_all_read)
+        self._wait_write = asyncify(self._primitive.wait_write)
+        self._notify_write = asyncify(self._primitive.notify_write)
+        self._notify_all_write = asyncify(self._primitive.notify_all_write)
 
     async def wait_read(self) -> None:
         """Wait for reading.
@@ -486,7 +889,7 @@ class AsyncSWaitableDoor(AsyncSAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        await await_if_awaitable(self._primitive.wait_read())
+        await self._wait_read()
         self._open()
 
     async def notify_read(self) -> None:
@@ -495,7 +898,7 @@ class AsyncSWaitableDoor(AsyncSAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        await await_if_awaitable(self._primitive.notify_read())
+        await self._notify_read()
         self._open()
 
     async def notify_all_read(self) -> None:
@@ -504,7 +907,7 @@ class AsyncSWaitableDoor(AsyncSAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        await await_if_awaitable(self._primitive.notify_all_read())
+        await self._notify_all_read()
         self._open()
 
     async def wait_write(self) -> None:
@@ -513,7 +916,7 @@ class AsyncSWaitableDoor(AsyncSAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        await await_if_awaitable(self._primitive.wait_write())
+        await self._wait_write()
         self._open()
 
     async def notify_write(self) -> None:
@@ -522,7 +925,7 @@ class AsyncSWaitableDoor(AsyncSAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        await await_if_awaitable(self._primitive.notify_write())
+        await self._notify_write()
         self._open()
 
     async def notify_all_write(self) -> None:
@@ -531,7 +934,7 @@ class AsyncSWaitableDoor(AsyncSAcquirableDoor[_T]):
         :return: ``None``.
         """
         self._close()
-        await await_if_awaitable(self._primitive.notify_all_write())
+        await self._notify_all_write()
         self._open()
 
 
@@ -546,6 +949,8 @@ class UnhandledDoor(Door[_T], ABC):
         if isinstance(self._resource_or_handle, Handle):
             raise ValueError('handle used')
 
+        super().__post_init__()
+
 
 class HandledDoor(Door[_T], ABC):
     """The abstract base class for handled doors.
@@ -559,11 +964,16 @@ class HandledDoor(Door[_T], ABC):
         if not isinstance(self._resource_or_handle, Handle):
             raise ValueError('handle not used')
 
+        super().__post_init__()
+
     def _setup(self, mode: Proxy.Mode) -> Proxy[_T]:
         self._proxy = super()._setup(mode)
 
         return self._proxy
 
+    def _handle_name(self) -> str:
+        return self._resource_or_handle.name  # type: ignore[union-attr]
+
     def _close(self) -> None:
         self._proxy.close()
 
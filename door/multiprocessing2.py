@@ -13,6 +13,7 @@ from door.doors import (
 )
 from door.primitives import (
     Acquirable,
+    PFLock as SyncPFLock,
     RSLock as SyncRSLock,
     SAcquirable,
     SCondition as SyncSCondition,
@@ -61,6 +62,37 @@ class WSLock(SyncWSLock):
         default_factory=ValueCounter,
         init=False,
     )
+    _num_readers_waiting: ValueCounter = field(
+        default_factory=ValueCounter,
+        init=False,
+    )
+
+
+@dataclass
+class PFLock(SyncPFLock):
+    """The class for phase-fair shared locks.
+
+    This class is designed to be used for multiprocessing.
+    """
+
+    _g: Waitable = field(default_factory=Condition)
+    _num_readers_active: ValueCounter = field(
+        default_factory=ValueCounter,
+        init=False,
+    )
+    _num_readers_waiting: ValueCounter = field(
+        default_factory=ValueCounter,
+        init=False,
+    )
+    _num_writers_waiting: ValueCounter = field(
+        default_factory=ValueCounter,
+        init=False,
+    )
+    _writer_active: ValueCounter = field(
+        default_factory=ValueCounter,
+        init=False,
+    )
+    _phase: ValueCounter = field(default_factory=ValueCounter, init=False)
 
 
 @dataclass
@@ -136,7 +168,7 @@ class SAcquirableDoor(HandledDoor[_T], SyncSAcquirableDoor[_T]):
     be raised.
     """
 
-    _primitive: SAcquirable = field(default_factory=WSLock)
+    _primitive: SAcquirable = field(default_factory=PFLock)
 
 
 @dataclass
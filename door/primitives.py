@@ -1,9 +1,10 @@
 """:mod:`door.primitives` defines the primitives."""
 
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
-from door.utilities import await_if_awaitable, Counter
+from door.utilities import asyncify, Counter
 
 
 @runtime_checkable
@@ -135,37 +136,68 @@ class AsyncRSLock:
     The implementations in this library is read-preferring and follow
     the pseudocode in Concurrent Programming: Algorithms, Principles,
     and Foundations by Michel Raynal.
+
+    As the counter is only updated between suspension points, it is
+    not guarded by ``_r`` unless the readers acquire ``_g``. Readers
+    joining active readers and readers leaving do not touch ``_r``.
     """
 
     _r: Acquirable
     _g: Acquirable
     _b: Counter = field(init=False)
+    _r_acquire: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _r_release: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _g_acquire: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _g_release: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self._r_acquire = asyncify(self._r.acquire)
+        self._r_release = asyncify(self._r.release)
+        self._g_acquire = asyncify(self._g.acquire)
+        self._g_release = asyncify(self._g.release)
 
     async def acquire_read(self) -> None:
-        await await_if_awaitable(self._r.acquire())
+        if self._b:
+            self._b.increment()
+
+            return
+
+        await self._r_acquire()
 
         if not self._b:
-            await await_if_awaitable(self._g.acquire())
+            await self._g_acquire()
 
         self._b.increment()
 
-        await await_if_awaitable(self._r.release())
+        await self._r_release()
 
     async def release_read(self) -> None:
-        await await_if_awaitable(self._r.acquire())
-
         self._b.decrement()
 
         if not self._b:
             self._g.release()
 
-        await await_if_awaitable(self._r.release())
-
     async def acquire_write(self) -> None:
-        await await_if_awaitable(self._g.acquire())
+        await self._g_acquire()
 
     async def release_write(self) -> None:
-        await await_if_awaitable(self._g.release())
+        await self._g_release()
 
 
 @dataclass
@@ -179,40 +211,113 @@ class WSLock:
     _num_writers_waiting: Counter = field(init=False)
     _writer_active: Counter = field(init=False)
     _num_readers_active: Counter = field(init=False)
+    _num_readers_waiting: Counter = field(init=False)
 
     def acquire_read(self) -> None:
         self._g.acquire()
 
-        while self._num_writers_waiting or self._writer_active:
-            self._g.wait()
+        try:
+            if self._num_writers_waiting or self._writer_active:
+                self._num_readers_waiting.increment()
 
-        self._num_readers_active.increment()
-        self._g.release()
+                try:
+                    while self._num_writers_waiting or self._writer_active:
+                        self._g.wait()
+                finally:
+                    self._num_readers_waiting.decrement()
+
+            self._num_readers_active.increment()
+        finally:
+            self._g.release()
 
     def release_read(self) -> None:
         self._g.acquire()
         self._num_readers_active.decrement()
 
-        if not self._num_readers_active:
+        if not self._num_readers_active and self._num_writers_waiting:
             self._g.notify_all()
 
         self._g.release()
 
     def acquire_write(self) -> None:
         self._g.acquire()
-        self._num_writers_waiting.increment()
 
-        while self._num_readers_active or self._writer_active:
-            self._g.wait()
+        try:
+            if self._num_readers_active or self._writer_active:
+                self._num_writers_waiting.increment()
 
-        self._num_writers_waiting.decrement()
-        self._writer_active.increment()
-        self._g.release()
+                try:
+                    while self._num_readers_active or self._writer_active:
+                        self._g.wait()
+                except BaseException:
+                    self._num_writers_waiting.decrement()
+
+                    if not (self._num_writers_waiting or self._writer_active):
+                        self._g.notify_all()
+
+                    raise
+
+                self._num_writers_waiting.decrement()
+
+            self._writer_active.increment()
+        finally:
+            self._g.release()
 
     def release_write(self) -> None:
         self._g.acquire()
         self._writer_active.decrement()
-        self._g.notify_all()
+
+        if self._num_writers_waiting or self._num_readers_waiting:
+            self._g.notify_all()
+
+        self._g.release()
+
+    def try_acquire_read(self) -> bool:
+        """Acquire the primitive for reading if it does not block.
+
+        :return: ``True`` if acquired, otherwise ``False``.
+        """
+        self._g.acquire()
+
+        acquired = not (self._num_writers_waiting or self._writer_active)
+
+        if acquired:
+            self._num_readers_active.increment()
+
+        self._g.release()
+
+        return acquired
+
+    def try_acquire_write(self) -> bool:
+        """Acquire the primitive for writing (and reading) if it does
+        not block.
+
+        :return: ``True`` if acquired, otherwise ``False``.
+        """
+        self._g.acquire()
+
+        acquired = not (self._num_readers_active or self._writer_active)
+
+        if acquired:
+            self._writer_active.increment()
+
+        self._g.release()
+
+        return acquired
+
+    def downgrade(self) -> None:
+        """Turn the held write acquisition into a read acquisition
+        without letting other writers in between.
+
+        :return: ``None``.
+        """
+        self._g.acquire()
+        self._writer_active.decrement()
+        self._num_readers_active.increment()
+
+        if self._num_readers_waiting and not self._num_writers_waiting:
+            self._g.notify_all()
+
         self._g.release()
 
 
@@ -227,47 +332,481 @@ class AsyncWSLock:
     _num_writers_waiting: Counter = field(init=False)
     _writer_active: Counter = field(init=False)
     _num_readers_active: Counter = field(init=False)
+    _num_readers_waiting: Counter = field(init=False)
+    _g_acquire: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _g_release: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _g_wait: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _g_notify_all: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self._g_acquire = asyncify(self._g.acquire)
+        self._g_release = asyncify(self._g.release)
+        self._g_wait = asyncify(self._g.wait)
+        self._g_notify_all = asyncify(self._g.notify_all)
 
     async def acquire_read(self) -> None:
-        await await_if_awaitable(self._g.acquire())
+        await self._g_acquire()
+
+        try:
+            if self._num_writers_waiting or self._writer_active:
+                self._num_readers_waiting.increment()
+
+                try:
+                    while self._num_writers_waiting or self._writer_active:
+                        await self._g_wait()
+                finally:
+                    self._num_readers_waiting.decrement()
+
+            self._num_readers_active.increment()
+        finally:
+            await self._g_release()
+
+    async def release_read(self) -> None:
+        await self._g_acquire()
+
+        self._num_readers_active.decrement()
+
+        if not self._num_readers_active and self._num_writers_waiting:
+            await self._g_notify_all()
+
+        await self._g_release()
+
+    async def acquire_write(self) -> None:
+        await self._g_acquire()
 
-        while self._num_writers_waiting or self._writer_active:
-            await await_if_awaitable(self._g.wait())
+        try:
+            if self._num_readers_active or self._writer_active:
+                self._num_writers_waiting.increment()
 
+                try:
+                    while self._num_readers_active or self._writer_active:
+                        await self._g_wait()
+                except BaseException:
+                    self._num_writers_waiting.decrement()
+
+                    if not (self._num_writers_waiting or self._writer_active):
+                        await self._g_notify_all()
+
+                    raise
+
+                self._num_writers_waiting.decrement()
+
+            self._writer_active.increment()
+        finally:
+            await self._g_release()
+
+    async def release_write(self) -> None:
+        await self._g_acquire()
+
+        self._writer_active.decrement()
+
+        if self._num_writers_waiting or self._num_readers_waiting:
+            await self._g_notify_all()
+
+        await self._g_release()
+
+    async def try_acquire_read(self) -> bool:
+        """Acquire the primitive for reading if it does not block.
+
+        :return: ``True`` if acquired, otherwise ``False``.
+        """
+        await self._g_acquire()
+
+        acquired = not (self._num_writers_waiting or self._writer_active)
+
+        if acquired:
+            self._num_readers_active.increment()
+
+        await self._g_release()
+
+        return acquired
+
+    async def try_acquire_write(self) -> bool:
+        """Acquire the primitive for writing (and reading) if it does
+        not block.
+
+        :return: ``True`` if acquired, otherwise ``False``.
+        """
+        await self._g_acquire()
+
+        acquired = not (self._num_readers_active or self._writer_active)
+
+        if acquired:
+            self._writer_active.increment()
+
+        await self._g_release()
+
+        return acquired
+
+    async def downgrade(self) -> None:
+        """Turn the held write acquisition into a read acquisition
+        without letting other writers in between.
+
+        :return: ``None``.
+        """
+        await self._g_acquire()
+
+        self._writer_active.decrement()
         self._num_readers_active.increment()
 
-        await await_if_awaitable(self._g.release())
+        if self._num_readers_waiting and not self._num_writers_waiting:
+            await self._g_notify_all()
+
+        await self._g_release()
+
+
+@dataclass
+class PFLock:
+    """The class for phase-fair shared locks.
+
+    This class is designed to be used for threading and multiprocessing.
+
+    Readers and writers alternate in phases: a reader waits for at most
+    one writer phase and a writer waits for at most one reader phase,
+    so neither side can be starved by the other. The implementation
+    follows the phase-fair readers-writer locks by Björn B. Brandenburg
+    and James H. Anderson. Phases are numbered by a counter that only
+    increases, so a waiting reader cannot mistake two phase changes for
+    none.
+    """
+
+    _g: Waitable
+    _num_readers_active: Counter = field(init=False)
+    _num_readers_waiting: Counter = field(init=False)
+    _num_writers_waiting: Counter = field(init=False)
+    _writer_active: Counter = field(init=False)
+    _phase: Counter = field(init=False)
+
+    def acquire_read(self) -> None:
+        self._g.acquire()
+
+        try:
+            if self._num_writers_waiting or self._writer_active:
+                phase = int(self._phase)
+
+                self._num_readers_waiting.increment()
+
+                try:
+                    while int(self._phase) == phase:
+                        self._g.wait()
+                except BaseException:
+                    if int(self._phase) == phase:
+                        self._num_readers_waiting.decrement()
+                    else:
+                        self._num_readers_active.decrement()
+
+                        if not self._num_readers_active:
+                            self._g.notify_all()
+
+                    raise
+            else:
+                self._num_readers_active.increment()
+        finally:
+            self._g.release()
+
+    def release_read(self) -> None:
+        self._g.acquire()
+        self._num_readers_active.decrement()
+
+        if not self._num_readers_active and self._num_writers_waiting:
+            self._g.notify_all()
+
+        self._g.release()
+
+    def acquire_write(self) -> None:
+        self._g.acquire()
+
+        try:
+            if self._num_readers_active or self._writer_active:
+                self._num_writers_waiting.increment()
+
+                try:
+                    while self._num_readers_active or self._writer_active:
+                        self._g.wait()
+                except BaseException:
+                    self._num_writers_waiting.decrement()
+
+                    if not (self._num_writers_waiting or self._writer_active):
+                        self._admit_readers()
+                        self._g.notify_all()
+
+                    raise
+
+                self._num_writers_waiting.decrement()
+
+            self._writer_active.increment()
+        finally:
+            self._g.release()
+
+    def release_write(self) -> None:
+        self._g.acquire()
+        self._writer_active.decrement()
+
+        if self._num_readers_waiting or self._num_writers_waiting:
+            self._admit_readers()
+            self._g.notify_all()
+
+        self._g.release()
+
+    def try_acquire_read(self) -> bool:
+        """Acquire the primitive for reading if it does not block.
+
+        :return: ``True`` if acquired, otherwise ``False``.
+        """
+        self._g.acquire()
+
+        acquired = not (self._num_writers_waiting or self._writer_active)
+
+        if acquired:
+            self._num_readers_active.increment()
+
+        self._g.release()
+
+        return acquired
+
+    def try_acquire_write(self) -> bool:
+        """Acquire the primitive for writing (and reading) if it does
+        not block.
+
+        :return: ``True`` if acquired, otherwise ``False``.
+        """
+        self._g.acquire()
+
+        acquired = not (self._num_readers_active or self._writer_active)
+
+        if acquired:
+            self._writer_active.increment()
+
+        self._g.release()
+
+        return acquired
+
+    def downgrade(self) -> None:
+        """Turn the held write acquisition into a read acquisition
+        without letting other writers in between.
+
+        The readers waiting for the writer phase to end join the new
+        reader phase.
+
+        :return: ``None``.
+        """
+        self._g.acquire()
+        self._writer_active.decrement()
+        self._num_readers_active.increment()
+
+        if self._num_readers_waiting:
+            self._admit_readers()
+            self._g.notify_all()
+
+        self._g.release()
+
+    def _admit_readers(self) -> None:
+        while self._num_readers_waiting:
+            self._num_readers_waiting.decrement()
+            self._num_readers_active.increment()
+
+        self._phase.increment()
+
+
+@dataclass
+class AsyncPFLock:
+    """The class for asynchronous phase-fair shared locks.
+
+    This class is designed to be used for asynchronous prgramming.
+
+    Readers and writers alternate in phases: a reader waits for at most
+    one writer phase and a writer waits for at most one reader phase,
+    so neither side can be starved by the other. The implementation
+    follows the phase-fair readers-writer locks by Björn B. Brandenburg
+    and James H. Anderson. Phases are numbered by a counter that only
+    increases, so a waiting reader cannot mistake two phase changes for
+    none.
+    """
+
+    _g: Waitable
+    _num_readers_active: Counter = field(init=False)
+    _num_readers_waiting: Counter = field(init=False)
+    _num_writers_waiting: Counter = field(init=False)
+    _writer_active: Counter = field(init=False)
+    _phase: Counter = field(init=False)
+    _g_acquire: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _g_release: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _g_wait: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _g_notify_all: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self._g_acquire = asyncify(self._g.acquire)
+        self._g_release = asyncify(self._g.release)
+        self._g_wait = asyncify(self._g.wait)
+        self._g_notify_all = asyncify(self._g.notify_all)
+
+    async def acquire_read(self) -> None:
+        await self._g_acquire()
+
+        try:
+            if self._num_writers_waiting or self._writer_active:
+                phase = int(self._phase)
+
+                self._num_readers_waiting.increment()
+
+                try:
+                    while int(self._phase) == phase:
+                        await self._g_wait()
+                except BaseException:
+                    if int(self._phase) == phase:
+                        self._num_readers_waiting.decrement()
+                    else:
+                        self._num_readers_active.decrement()
+
+                        if not self._num_readers_active:
+                            await self._g_notify_all()
+
+                    raise
+            else:
+                self._num_readers_active.increment()
+        finally:
+            await self._g_release()
 
     async def release_read(self) -> None:
-        await await_if_awaitable(self._g.acquire())
+        await self._g_acquire()
 
         self._num_readers_active.decrement()
 
-        if not self._num_readers_active:
-            await await_if_awaitable(self._g.notify_all())
+        if not self._num_readers_active and self._num_writers_waiting:
+            await self._g_notify_all()
 
-        await await_if_awaitable(self._g.release())
+        await self._g_release()
 
     async def acquire_write(self) -> None:
-        await await_if_awaitable(self._g.acquire())
+        await self._g_acquire()
+
+        try:
+            if self._num_readers_active or self._writer_active:
+                self._num_writers_waiting.increment()
 
-        self._num_writers_waiting.increment()
+                try:
+                    while self._num_readers_active or self._writer_active:
+                        await self._g_wait()
+                except BaseException:
+                    self._num_writers_waiting.decrement()
 
-        while self._num_readers_active or self._writer_active:
-            await await_if_awaitable(self._g.wait())
+                    if not (self._num_writers_waiting or self._writer_active):
+                        self._admit_readers()
 
-        self._num_writers_waiting.decrement()
-        self._writer_active.increment()
+                        await self._g_notify_all()
 
-        await await_if_awaitable(self._g.release())
+                    raise
+
+                self._num_writers_waiting.decrement()
+
+            self._writer_active.increment()
+        finally:
+            await self._g_release()
 
     async def release_write(self) -> None:
-        await await_if_awaitable(self._g.acquire())
+        await self._g_acquire()
 
         self._writer_active.decrement()
 
-        await await_if_awaitable(self._g.notify_all())
-        await await_if_awaitable(self._g.release())
+        if self._num_readers_waiting or self._num_writers_waiting:
+            self._admit_readers()
+
+            await self._g_notify_all()
+
+        await self._g_release()
+
+    async def try_acquire_read(self) -> bool:
+        """Acquire the primitive for reading if it does not block.
+
+        :return: ``True`` if acquired, otherwise ``False``.
+        """
+        await self._g_acquire()
+
+        acquired = not (self._num_writers_waiting or self._writer_active)
+
+        if acquired:
+            self._num_readers_active.increment()
+
+        await self._g_release()
+
+        return acquired
+
+    async def try_acquire_write(self) -> bool:
+        """Acquire the primitive for writing (and reading) if it does
+        not block.
+
+        :return: ``True`` if acquired, otherwise ``False``.
+        """
+        await self._g_acquire()
+
+        acquired = not (self._num_readers_active or self._writer_active)
+
+        if acquired:
+            self._writer_active.increment()
+
+        await self._g_release()
+
+        return acquired
+
+    async def downgrade(self) -> None:
+        """Turn the held write acquisition into a read acquisition
+        without letting other writers in between.
+
+        The readers waiting for the writer phase to end join the new
+        reader phase.
+
+        :return: ``None``.
+        """
+        await self._g_acquire()
+
+        self._writer_active.decrement()
+        self._num_readers_active.increment()
+
+        if self._num_readers_waiting:
+            self._admit_readers()
+
+            await self._g_notify_all()
+
+        await self._g_release()
+
+    def _admit_readers(self) -> None:
+        while self._num_readers_waiting:
+            self._num_readers_waiting.decrement()
+            self._num_readers_active.increment()
+
+        self._phase.increment()
 
 
 @dataclass
@@ -290,21 +829,17 @@ class SCondition:
         self._a.acquire()
         self._s.release_read()
         self._a.wait()
-        self._s.acquire_read()
         self._a.release()
+        self._s.acquire_read()
 
     def notify_read(self) -> None:
         self._a.acquire()
-        self._s.release_read()
         self._a.notify()
-        self._s.acquire_read()
         self._a.release()
 
     def notify_all_read(self) -> None:
         self._a.acquire()
-        self._s.release_read()
         self._a.notify_all()
-        self._s.acquire_read()
         self._a.release()
 
     def acquire_write(self) -> None:
@@ -317,21 +852,17 @@ class SCondition:
         self._a.acquire()
         self._s.release_write()
         self._a.wait()
-        self._s.acquire_write()
         self._a.release()
+        self._s.acquire_write()
 
     def notify_write(self) -> None:
         self._a.acquire()
-        self._s.release_write()
         self._a.notify()
-        self._s.acquire_write()
         self._a.release()
 
     def notify_all_write(self) -> None:
         self._a.acquire()
-        self._s.release_write()
         self._a.notify_all()
-        self._s.acquire_write()
         self._a.release()
 
 
@@ -344,57 +875,105 @@ class AsyncSCondition:
 
     _s: SAcquirable
     _a: Waitable
+    _s_acquire_read: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _s_release_read: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _s_acquire_write: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _s_release_write: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _a_acquire: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _a_release: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _a_wait: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _a_notify: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _a_notify_all: Callable[[], Awaitable[None]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self._s_acquire_read = asyncify(self._s.acquire_read)
+        self._s_release_read = asyncify(self._s.release_read)
+        self._s_acquire_write = asyncify(self._s.acquire_write)
+        self._s_release_write = asyncify(self._s.release_write)
+        self._a_acquire = asyncify(self._a.acquire)
+        self._a_release = asyncify(self._a.release)
+        self._a_wait = asyncify(self._a.wait)
+        self._a_notify = asyncify(self._a.notify)
+        self._a_notify_all = asyncify(self._a.notify_all)
 
     async def acquire_read(self) -> None:
-        await await_if_awaitable(self._s.acquire_read())
+        await self._s_acquire_read()
 
     async def release_read(self) -> None:
-        await await_if_awaitable(self._s.release_read())
+        await self._s_release_read()
 
     async def wait_read(self) -> None:
-        await await_if_awaitable(self._a.acquire())
-        await await_if_awaitable(self._s.release_read())
-        await await_if_awaitable(self._a.wait())
-        await await_if_awaitable(self._s.acquire_read())
-        await await_if_awaitable(self._a.release())
+        await self._a_acquire()
+        await self._s_release_read()
+        await self._a_wait()
+        await self._a_release()
+        await self._s_acquire_read()
 
     async def notify_read(self) -> None:
-        await await_if_awaitable(self._a.acquire())
-        await await_if_awaitable(self._s.release_read())
-        await await_if_awaitable(self._a.notify())
-        await await_if_awaitable(self._s.acquire_read())
-        await await_if_awaitable(self._a.release())
+        await self._a_acquire()
+        await self._a_notify()
+        await self._a_release()
 
     async def notify_all_read(self) -> None:
-        await await_if_awaitable(self._a.acquire())
-        await await_if_awaitable(self._s.release_read())
-        await await_if_awaitable(self._a.notify_all())
-        await await_if_awaitable(self._s.acquire_read())
-        await await_if_awaitable(self._a.release())
+        await self._a_acquire()
+        await self._a_notify_all()
+        await self._a_release()
 
     async def acquire_write(self) -> None:
-        await await_if_awaitable(self._s.acquire_write())
+        await self._s_acquire_write()
 
     async def release_write(self) -> None:
-        await await_if_awaitable(self._s.release_write())
+        await self._s_release_write()
 
     async def wait_write(self) -> None:
-        await await_if_awaitable(self._a.acquire())
-        await await_if_awaitable(self._s.release_write())
-        await await_if_awaitable(self._a.wait())
-        await await_if_awaitable(self._s.acquire_write())
-        await await_if_awaitable(self._a.release())
+        await self._a_acquire()
+        await self._s_release_write()
+        await self._a_wait()
+        await self._a_release()
+        await self._s_acquire_write()
 
     async def notify_write(self) -> None:
-        await await_if_awaitable(self._a.acquire())
-        await await_if_awaitable(self._s.release_write())
-        await await_if_awaitable(self._a.notify())
-        await await_if_awaitable(self._s.acquire_write())
-        await await_if_awaitable(self._a.release())
+        await self._a_acquire()
+        await self._a_notify()
+        await self._a_release()
 
     async def notify_all_write(self) -> None:
-        await await_if_awaitable(self._a.acquire())
-        await await_if_awaitable(self._s.release_write())
-        await await_if_awaitable(self._a.notify_all())
-        await await_if_awaitable(self._s.acquire_write())
-        await await_if_awaitable(self._a.release())
+        await self._a_acquire()
+        await self._a_notify_all()
+        await self._a_release()
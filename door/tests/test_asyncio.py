@@ -1,16 +1,27 @@
 from asyncio import (
     BoundedSemaphore,
+    CancelledError,
     Condition,
     create_task,
+    Event,
     gather,
+    get_event_loop_policy,
     Lock,
     Semaphore,
+    set_event_loop_policy,
+    sleep,
+    wait_for,
 )
-from dataclasses import dataclass
-from unittest import IsolatedAsyncioTestCase, main
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from time import monotonic
+from unittest import IsolatedAsyncioTestCase, main, skipUnless, TestCase
 
 from door.asyncio2 import (
     AcquirableDoor,
+    install_uvloop,
+    PFLock,
     RSCondition,
     RSLock,
     SAcquirableDoor,
@@ -23,6 +34,67 @@ from door.multiprocessing2 import Handle
 from door.primitives import Acquirable, SAcquirable, SWaitable, Waitable
 
 
+@dataclass
+class CoroutineCondition:
+    """Condition variable with coroutine notify methods."""
+
+    _condition: Condition = field(default_factory=Condition)
+
+    async def acquire(self) -> None:
+        await self._condition.acquire()
+
+    def release(self) -> None:
+        self._condition.release()
+
+    async def wait(self) -> None:
+        await self._condition.wait()
+
+    async def notify(self) -> None:
+        self._condition.notify()
+
+    async def notify_all(self) -> None:
+        self._condition.notify_all()
+
+
+@dataclass
+class SyncSCondition:
+    """Shared condition variable with synchronous methods returning
+    awaitables.
+    """
+
+    _condition: WSCondition = field(default_factory=WSCondition)
+
+    def acquire_read(self) -> Awaitable[None]:
+        return self._condition.acquire_read()
+
+    def release_read(self) -> Awaitable[None]:
+        return self._condition.release_read()
+
+    def wait_read(self) -> Awaitable[None]:
+        return self._condition.wait_read()
+
+    def notify_read(self) -> Awaitable[None]:
+        return self._condition.notify_read()
+
+    def notify_all_read(self) -> Awaitable[None]:
+        return self._condition.notify_all_read()
+
+    def acquire_write(self) -> Awaitable[None]:
+        return self._condition.acquire_write()
+
+    def release_write(self) -> Awaitable[None]:
+        return self._condition.release_write()
+
+    def wait_write(self) -> Awaitable[None]:
+        return self._condition.wait_write()
+
+    def notify_write(self) -> Awaitable[None]:
+        return self._condition.notify_write()
+
+    def notify_all_write(self) -> Awaitable[None]:
+        return self._condition.notify_all_write()
+
+
 class AsyncioTestCase(IsolatedAsyncioTestCase):
     @dataclass
     class Resource:
@@ -37,12 +109,47 @@ class AsyncioTestCase(IsolatedAsyncioTestCase):
     class Counter:
         value: int = 0
 
+    @dataclass
+    class Counts:
+        readers: int = 0
+        writers: int = 0
+
     def test_unhandled(self) -> None:
         handle = Handle(None)
 
         self.assertRaises(ValueError, AcquirableDoor, handle, Lock())
+        self.assertRaises(ValueError, WaitableDoor, handle, Condition())
+        self.assertRaises(ValueError, SWaitableDoor, handle, WSCondition())
         handle.unlink()
 
+    def test_post_init(self) -> None:
+        lock = Lock()
+        a_door = AcquirableDoor(self.Flags(), lock)
+
+        self.assertEqual(a_door._acquire, lock.acquire)
+        self.assertNotEqual(a_door._release, lock.release)
+
+        s_lock = PFLock()
+        sa_door = SAcquirableDoor(self.Flags(), s_lock)
+
+        self.assertEqual(sa_door._acquire_write, s_lock.acquire_write)
+
+        condition = CoroutineCondition()
+        door = WaitableDoor(self.Flags(), condition)
+
+        self.assertEqual(door._wait, condition.wait)
+        self.assertEqual(door._notify, condition.notify)
+        self.assertEqual(door._notify_all, condition.notify_all)
+
+        s_condition = WSCondition()
+        s_door = SWaitableDoor(self.Flags(), s_condition)
+
+        self.assertEqual(s_door._wait_read, s_condition.wait_read)
+        self.assertEqual(
+            s_door._notify_all_write,
+            s_condition.notify_all_write,
+        )
+
     async def test_acquirable(self) -> None:
         for primitive in (
                 Lock(),
@@ -76,6 +183,7 @@ class AsyncioTestCase(IsolatedAsyncioTestCase):
 
         for primitive in (
                 Condition(),
+                CoroutineCondition(),
         ):
             assert isinstance(primitive, Waitable)
 
@@ -100,6 +208,7 @@ class AsyncioTestCase(IsolatedAsyncioTestCase):
         for primitive in (
                 RSLock(),
                 WSLock(),
+                PFLock(),
                 RSCondition(),
                 WSCondition(),
         ):
@@ -141,6 +250,7 @@ class AsyncioTestCase(IsolatedAsyncioTestCase):
         for primitive in (
                 RSLock(),
                 WSLock(),
+                PFLock(),
                 RSCondition(),
                 WSCondition(),
         ):
@@ -172,6 +282,7 @@ class AsyncioTestCase(IsolatedAsyncioTestCase):
         for primitive in (
                 RSCondition(),
                 WSCondition(),
+                SyncSCondition(),
         ):
             assert isinstance(primitive, SWaitable)
 
@@ -192,6 +303,219 @@ class AsyncioTestCase(IsolatedAsyncioTestCase):
 
             await task
 
+    async def test_read_preferring(self) -> None:
+        primitive = RSLock()
+
+        await primitive.acquire_read()
+        await primitive._r.acquire()
+        await wait_for(primitive.acquire_read(), 1)
+        await wait_for(primitive.release_read(), 1)
+        primitive._r.release()
+        await primitive.release_read()
+        await wait_for(primitive.acquire_write(), 1)
+        await primitive.release_write()
+
+    async def test_write_preferring(self) -> None:
+        TIMEOUT = 1
+
+        primitive = WSLock()
+
+        await primitive.acquire_write()
+
+        task = create_task(primitive.acquire_read())
+
+        await sleep(0)
+        task.cancel()
+
+        with self.assertRaises(CancelledError):
+            await task
+
+        await wait_for(primitive.release_write(), TIMEOUT)
+        await wait_for(primitive.acquire_write(), TIMEOUT)
+        await primitive.release_write()
+
+        await primitive.acquire_read()
+
+        task = create_task(primitive.acquire_write())
+
+        await sleep(0)
+
+        reader = create_task(primitive.acquire_read())
+
+        await sleep(0)
+        self.assertFalse(reader.done())
+        task.cancel()
+
+        with self.assertRaises(CancelledError):
+            await task
+
+        await wait_for(reader, TIMEOUT)
+        await primitive.release_read()
+        await primitive.release_read()
+        await wait_for(primitive.acquire_write(), TIMEOUT)
+        await primitive.release_write()
+
+    async def test_phase_fair_0(self) -> None:
+        READER_COUNT = 5
+        WRITE_COUNT = 20
+        TIMEOUT = 1
+        HOLD_TIME = 0.001
+
+        primitive = PFLock()
+        stop = Event()
+        counts = self.Counts()
+        violations = []
+
+        async def reader() -> None:
+            while not stop.is_set():
+                await primitive.acquire_read()
+
+                counts.readers += 1
+
+                if counts.writers:
+                    violations.append('reader')
+
+                await sleep(HOLD_TIME)
+
+                counts.readers -= 1
+
+                await primitive.release_read()
+
+        tasks = []
+
+        for _ in range(READER_COUNT):
+            task = create_task(reader())
+
+            tasks.append(task)
+
+        await sleep(HOLD_TIME)
+
+        for _ in range(WRITE_COUNT):
+            timestamp = monotonic()
+
+            await primitive.acquire_write()
+
+            self.assertLess(monotonic() - timestamp, TIMEOUT)
+
+            counts.writers += 1
+
+            if counts.readers or counts.writers > 1:
+                violations.append('writer')
+
+            await sleep(HOLD_TIME)
+
+            counts.writers -= 1
+
+            await primitive.release_write()
+
+        stop.set()
+        await gather(*tasks)
+
+        self.assertFalse(violations)
+
+    async def test_phase_fair_1(self) -> None:
+        TIMEOUT = 1
+
+        primitive = PFLock()
+
+        await primitive.acquire_write()
+
+        task = create_task(primitive.acquire_read())
+
+        await sleep(0)
+        task.cancel()
+
+        with self.assertRaises(CancelledError):
+            await task
+
+        await wait_for(primitive.release_write(), TIMEOUT)
+        await wait_for(primitive.acquire_write(), TIMEOUT)
+        await primitive.release_write()
+
+        await primitive.acquire_read()
+
+        task = create_task(primitive.acquire_write())
+
+        await sleep(0)
+
+        reader = create_task(primitive.acquire_read())
+
+        await sleep(0)
+        task.cancel()
+
+        with self.assertRaises(CancelledError):
+            await task
+
+        await wait_for(reader, TIMEOUT)
+        await primitive.release_read()
+        await primitive.release_read()
+        await wait_for(primitive.acquire_write(), TIMEOUT)
+        await primitive.release_write()
+
+    async def test_phase_fair_2(self) -> None:
+        TIMEOUT = 1
+
+        primitive = PFLock()
+
+        await primitive.acquire_write()
+
+        writer = create_task(primitive.acquire_write())
+
+        await sleep(0)
+
+        reader = create_task(primitive.acquire_read())
+
+        await sleep(0)
+        await primitive.release_write()
+        writer.cancel()
+
+        with self.assertRaises(CancelledError):
+            await writer
+
+        await wait_for(reader, TIMEOUT)
+        await primitive.release_read()
+        await wait_for(primitive.acquire_write(), TIMEOUT)
+        await primitive.release_write()
+
+    async def test_downgrade(self) -> None:
+        TIMEOUT = 1
+
+        for primitive in (WSLock(), PFLock()):
+            self.assertTrue(await primitive.try_acquire_read())
+            self.assertFalse(await primitive.try_acquire_write())
+            await primitive.release_read()
+            self.assertTrue(await primitive.try_acquire_write())
+            self.assertFalse(await primitive.try_acquire_read())
+
+            reader = create_task(primitive.acquire_read())
+
+            await sleep(0)
+            self.assertFalse(reader.done())
+            await primitive.downgrade()
+            await wait_for(reader, TIMEOUT)
+            self.assertFalse(await primitive.try_acquire_write())
+            await primitive.release_read()
+            await primitive.release_read()
+            self.assertTrue(await primitive.try_acquire_write())
+            await primitive.release_write()
+
+
+class InstallUvloopTestCase(TestCase):
+    @skipUnless(find_spec('uvloop'), 'uvloop is not installed')
+    def test_install_uvloop(self) -> None:
+        import uvloop  # type: ignore[import-not-found]
+
+        policy = get_event_loop_policy()
+
+        try:
+            install_uvloop()
+            self.assertIsInstance(
+                get_event_loop_policy(),
+                uvloop.EventLoopPolicy,
+            )
+        finally:
+            set_event_loop_policy(policy)
+
 
 if __name__ == '__main__':
     main()  # pragma: no cover
@@ -2,17 +2,23 @@ from dataclasses import dataclass
 from multiprocessing import (
     BoundedSemaphore,
     Condition,
+    Event,
+    get_context,
     Lock,
     RLock,
     Semaphore,
     Process,
+    Value,
 )
+from time import monotonic, sleep
+from typing import Any
 from unittest import main, TestCase
 
 from door.primitives import Acquirable, SAcquirable, SWaitable, Waitable
 from door.multiprocessing2 import (
     AcquirableDoor,
     Handle,
+    PFLock,
     RSCondition,
     RSLock,
     SAcquirableDoor,
@@ -23,6 +29,27 @@ from door.multiprocessing2 import (
 )
 
 
+def increment(
+        door: AcquirableDoor[Any],
+        s_door: SAcquirableDoor[Any],
+) -> None:  # pragma: no cover
+    with door() as proxy:
+        proxy.value += 1
+
+    with s_door.write() as proxy:
+        proxy.value += 1
+
+
+def increment_many(
+        doors: tuple[AcquirableDoor[Any], ...],
+        count: int,
+) -> None:  # pragma: no cover
+    for _ in range(count):
+        with AcquirableDoor.acquire_many(*doors) as proxies:
+            for proxy in proxies:
+                proxy.value += 1
+
+
 class MultiprocessingTestCase(TestCase):
     @dataclass
     class Resource:
@@ -108,6 +135,7 @@ class MultiprocessingTestCase(TestCase):
         for primitive in (
                 RSLock(),
                 WSLock(),
+                PFLock(),
                 RSCondition(),
                 WSCondition(),
         ):
@@ -153,6 +181,7 @@ class MultiprocessingTestCase(TestCase):
         for primitive in (
                 RSLock(),
                 WSLock(),
+                PFLock(),
                 RSCondition(),
                 WSCondition(),
         ):
@@ -181,6 +210,80 @@ class MultiprocessingTestCase(TestCase):
 
             handle.unlink()
 
+    def test_spawn(self) -> None:
+        PARALLELISM_COUNT = 3
+
+        context = get_context('spawn')
+        handle = Handle(self.Counter())
+        s_handle = Handle(self.Counter())
+        door = AcquirableDoor[MultiprocessingTestCase.Counter](
+            handle,
+            context.Lock(),
+        )
+        s_door = SAcquirableDoor[MultiprocessingTestCase.Counter](
+            s_handle,
+            PFLock(context.Condition()),
+        )
+        processes = []
+
+        for _ in range(PARALLELISM_COUNT):
+            process = context.Process(target=increment, args=(door, s_door))
+
+            process.start()
+            processes.append(process)
+
+        for process in processes:
+            process.join()
+
+        self.assertEqual(handle.get().value, PARALLELISM_COUNT)
+        self.assertEqual(s_handle.get().value, PARALLELISM_COUNT)
+
+        handle.unlink()
+        s_handle.unlink()
+
+    def test_acquire_many(self) -> None:
+        ITER_COUNT = 100
+        PARALLELISM_COUNT = 4
+
+        context = get_context('spawn')
+        handles = [Handle(self.Counter()) for _ in range(4)]
+        doors = tuple(
+            AcquirableDoor[MultiprocessingTestCase.Counter](
+                handle,
+                context.Lock(),
+            )
+            for handle in handles
+        )
+        processes = []
+
+        for i in range(PARALLELISM_COUNT):
+            process = context.Process(
+                target=increment_many,
+                args=(doors[::(-1) ** i], ITER_COUNT),
+            )
+
+            process.start()
+            processes.append(process)
+
+        for process in processes:
+            process.join()
+
+        for handle in handles:
+            self.assertEqual(
+                handle.get().value,
+                ITER_COUNT * PARALLELISM_COUNT,
+            )
+
+        self.assertRaises(
+            ValueError,
+            AcquirableDoor.acquire_many,
+            doors[0],
+            doors[0],
+        )
+
+        for handle in handles:
+            handle.unlink()
+
     def test_shared_waitable(self) -> None:
         def worker() -> None:  # pragma: no cover
             with door.write() as proxy:
@@ -220,6 +323,73 @@ class MultiprocessingTestCase(TestCase):
             process.join()
             handle.unlink()
 
+    def test_phase_fair(self) -> None:
+        READER_COUNT = 5
+        WRITE_COUNT = 20
+        TIMEOUT = 1
+        HOLD_TIME = 0.001
+
+        primitive = PFLock()
+        stop = Event()
+        readers = Value('i', 0)
+        writers = Value('i', 0)
+        violations = Value('i', 0)
+
+        def reader() -> None:  # pragma: no cover
+            while not stop.is_set():
+                primitive.acquire_read()
+
+                with readers.get_lock():
+                    readers.value += 1
+
+                    if writers.value:
+                        violations.value += 1
+
+                sleep(HOLD_TIME)
+
+                with readers.get_lock():
+                    readers.value -= 1
+
+                primitive.release_read()
+
+        processes = []
+
+        for _ in range(READER_COUNT):
+            process = Process(target=reader)
+
+            process.start()
+            processes.append(process)
+
+        while not readers.value:
+            sleep(HOLD_TIME)
+
+        for _ in range(WRITE_COUNT):
+            timestamp = monotonic()
+
+            primitive.acquire_write()
+
+            self.assertLess(monotonic() - timestamp, TIMEOUT)
+
+            with readers.get_lock():
+                writers.value += 1
+
+                if readers.value or writers.value > 1:
+                    violations.value += 1
+
+            sleep(HOLD_TIME)
+
+            with readers.get_lock():
+                writers.value -= 1
+
+            primitive.release_write()
+
+        stop.set()
+
+        for process in processes:
+            process.join()
+
+        self.assertEqual(violations.value, 0)
+
 
 if __name__ == '__main__':
     main()  # pragma: no cover
@@ -2,17 +2,22 @@ from dataclasses import dataclass
 from threading import (
     BoundedSemaphore,
     Condition,
+    Event,
     Lock,
     RLock,
     Semaphore,
     Thread,
 )
+from time import monotonic, sleep
+from typing import Any
 from unittest import main, TestCase
 
+from door.doors import WouldBlock
 from door.multiprocessing2 import Handle
 from door.primitives import Acquirable, SAcquirable, SWaitable, Waitable
 from door.threading2 import (
     AcquirableDoor,
+    PFLock,
     RSCondition,
     RSLock,
     SAcquirableDoor,
@@ -37,6 +42,11 @@ class ThreadingTestCase(TestCase):
     class Counter:
         value: int = 0
 
+    @dataclass
+    class Counts:
+        readers: int = 0
+        writers: int = 0
+
     def test_unhandled(self) -> None:
         handle = Handle(None)
 
@@ -65,6 +75,73 @@ class ThreadingTestCase(TestCase):
             self.assertRaises(ValueError, setattr, proxy, 'key', 'value')
             self.assertEqual(resource, self.Resource('VALUE'))
 
+            with door.try_acquire() as proxy:
+                self.assertEqual(proxy.key, 'VALUE')
+
+            self.assertRaises(ValueError, getattr, proxy, 'key')
+
+            errors = []
+
+            def try_acquire() -> None:
+                try:
+                    with door.try_acquire():
+                        pass  # pragma: no cover
+                except WouldBlock as error:
+                    errors.append(error)
+
+            with door():
+                thread = Thread(target=try_acquire)
+
+                thread.start()
+                thread.join()
+
+            self.assertEqual(len(errors), 1)
+
+    def test_acquire_many(self) -> None:
+        ITER_COUNT = 1000
+        PARALLELISM_COUNT = 10
+
+        lock = Lock()
+        doors = (
+            AcquirableDoor(self.Counter(), Lock()),
+            AcquirableDoor(self.Counter(), lock),
+            AcquirableDoor(self.Counter(), lock),
+        )
+
+        def target(doors: tuple[AcquirableDoor[Any], ...]) -> None:
+            for _ in range(ITER_COUNT):
+                with AcquirableDoor.acquire_many(*doors) as proxies:
+                    for proxy in proxies:
+                        proxy.value += 1
+
+        threads = []
+
+        for i in range(PARALLELISM_COUNT):
+            thread = Thread(target=target, args=(doors[::(-1) ** i],))
+
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+
+        for door in doors:
+            with door() as proxy:
+                self.assertEqual(proxy.value, ITER_COUNT * PARALLELISM_COUNT)
+
+        with AcquirableDoor.acquire_many(*doors) as proxies:
+            pass
+
+        for proxy in proxies:
+            self.assertRaises(ValueError, getattr, proxy, 'value')
+
+        self.assertRaises(
+            ValueError,
+            AcquirableDoor.acquire_many,
+            doors[0],
+            doors[0],
+        )
+
     def test_waitable(self) -> None:
         def worker() -> None:
             with door() as proxy:
@@ -103,6 +180,7 @@ class ThreadingTestCase(TestCase):
         for primitive in (
                 RSLock(),
                 WSLock(),
+                PFLock(),
                 RSCondition(),
                 WSCondition(),
         ):
@@ -144,6 +222,7 @@ class ThreadingTestCase(TestCase):
         for primitive in (
                 RSLock(),
                 WSLock(),
+                PFLock(),
                 RSCondition(),
                 WSCondition(),
         ):
@@ -199,6 +278,139 @@ class ThreadingTestCase(TestCase):
 
             thread.join()
 
+    def test_try_acquire_shared(self) -> None:
+        for primitive in (WSLock(), PFLock()):
+            self.assertTrue(primitive.try_acquire_read())
+            self.assertTrue(primitive.try_acquire_read())
+            self.assertFalse(primitive.try_acquire_write())
+            primitive.release_read()
+            primitive.release_read()
+            self.assertTrue(primitive.try_acquire_write())
+            self.assertFalse(primitive.try_acquire_read())
+            self.assertFalse(primitive.try_acquire_write())
+            primitive.release_write()
+
+        door = SAcquirableDoor(self.Resource(), WSLock())
+
+        with door.try_read() as proxy:
+            self.assertEqual(proxy.key, 'value')
+
+            with door.try_read():
+                pass
+
+            with self.assertRaises(WouldBlock):
+                with door.try_write():
+                    pass  # pragma: no cover
+
+        with door.try_write() as proxy:
+            proxy.key = 'VALUE'
+
+            with self.assertRaises(WouldBlock):
+                with door.try_read():
+                    pass  # pragma: no cover
+
+        self.assertRaises(ValueError, getattr, proxy, 'key')
+
+    def test_downgrade(self) -> None:
+        TIMEOUT = 1
+
+        for primitive in (WSLock(), PFLock()):
+            primitive.acquire_write()
+            primitive.downgrade()
+            self.assertTrue(primitive.try_acquire_read())
+            self.assertFalse(primitive.try_acquire_write())
+            primitive.release_read()
+            primitive.release_read()
+            self.assertTrue(primitive.try_acquire_write())
+            primitive.release_write()
+
+            acquired = Event()
+
+            def read() -> None:
+                primitive.acquire_read()
+                acquired.set()
+
+            primitive.acquire_write()
+
+            thread = Thread(target=read)
+
+            thread.start()
+            self.assertFalse(acquired.wait(0.01))
+            primitive.downgrade()
+            self.assertTrue(acquired.wait(TIMEOUT))
+            thread.join()
+            primitive.release_read()
+            primitive.release_read()
+            self.assertTrue(primitive.try_acquire_write())
+            primitive.release_write()
+
+    def test_phase_fair(self) -> None:
+        READER_COUNT = 5
+        WRITE_COUNT = 20
+        TIMEOUT = 1
+        HOLD_TIME = 0.001
+
+        primitive = PFLock()
+        stop = Event()
+        guard = Lock()
+        counts = self.Counts()
+        violations = []
+
+        def reader() -> None:
+            while not stop.is_set():
+                primitive.acquire_read()
+
+                with guard:
+                    counts.readers += 1
+
+                    if counts.writers:
+                        violations.append('reader')
+
+                sleep(HOLD_TIME)
+
+                with guard:
+                    counts.readers -= 1
+
+                primitive.release_read()
+
+        threads = []
+
+        for _ in range(READER_COUNT):
+            thread = Thread(target=reader)
+
+            thread.start()
+            threads.append(thread)
+
+        while not counts.readers:
+            sleep(HOLD_TIME)
+
+        for _ in range(WRITE_COUNT):
+            timestamp = monotonic()
+
+            primitive.acquire_write()
+
+            self.assertLess(monotonic() - timestamp, TIMEOUT)
+
+            with guard:
+                counts.writers += 1
+
+                if counts.readers or counts.writers > 1:
+                    violations.append('writer')
+
+            sleep(HOLD_TIME)
+
+            with guard:
+                counts.writers -= 1
+
+            primitive.release_write()
+
+        stop.set()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertFalse(violations)
+
 
 if __name__ == '__main__':
     main()  # pragma: no cover
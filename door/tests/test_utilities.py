@@ -1,8 +1,10 @@
+from asyncio import Lock
 from dataclasses import dataclass
+from pickle import dumps, loads
 from typing import Any
-from unittest import main, TestCase
+from unittest import IsolatedAsyncioTestCase, main, TestCase
 
-from door.utilities import Proxy
+from door.utilities import asyncify, Handle, Proxy
 
 
 class ResourceTestCase(TestCase):
@@ -43,5 +45,33 @@ class ResourceTestCase(TestCase):
         proxy.close()
 
 
+class HandleTestCase(TestCase):
+    def test_set(self) -> None:
+        handle = Handle([1, 2, 3])
+        other = loads(dumps(handle))
+
+        self.assertEqual(other.get(), [1, 2, 3])
+        handle.set(list(range(100)))
+        self.assertEqual(other.get(), list(range(100)))
+        other.set(None)
+        self.assertIsNone(handle.get())
+        handle.unlink()
+
+
+class AsyncifyTestCase(IsolatedAsyncioTestCase):
+    async def test_asyncify(self) -> None:
+        lock = Lock()
+
+        self.assertEqual(asyncify(lock.acquire), lock.acquire)
+        await asyncify(lock.acquire)()
+        self.assertTrue(lock.locked())
+        await asyncify(lock.release)()
+        self.assertFalse(lock.locked())
+
+        await asyncify(lambda: lock.acquire())()
+        self.assertTrue(lock.locked())
+        await asyncify(lambda: None)()
+
+
 if __name__ == '__main__':
     main()  # pragma: no cover
@@ -13,6 +13,7 @@ from door.doors import (
 )
 from door.primitives import (
     Acquirable,
+    PFLock as SyncPFLock,
     RSLock as SyncRSLock,
     SAcquirable,
     SCondition as SyncSCondition,
@@ -58,6 +59,34 @@ class WSLock(SyncWSLock):
         default_factory=IntCounter,
         init=False,
     )
+    _num_readers_waiting: IntCounter = field(
+        default_factory=IntCounter,
+        init=False,
+    )
+
+
+@dataclass
+class PFLock(SyncPFLock):
+    """The class for phase-fair shared locks.
+
+    This class is designed to be used for threading.
+    """
+
+    _g: Waitable = field(default_factory=Condition)
+    _num_readers_active: IntCounter = field(
+        default_factory=IntCounter,
+        init=False,
+    )
+    _num_readers_waiting: IntCounter = field(
+        default_factory=IntCounter,
+        init=False,
+    )
+    _num_writers_waiting: IntCounter = field(
+        default_factory=IntCounter,
+        init=False,
+    )
+    _writer_active: IntCounter = field(default_factory=IntCounter, init=False)
+    _phase: IntCounter = field(default_factory=IntCounter, init=False)
 
 
 @dataclass
@@ -133,7 +162,7 @@ class SAcquirableDoor(UnhandledDoor[_T], SyncSAcquirableDoor[_T]):
     be raised.
     """
 
-    _primitive: SAcquirable = field(default_factory=WSLock)
+    _primitive: SAcquirable = field(default_factory=PFLock)
 
 
 @dataclass
@@ -1,9 +1,10 @@
 """:mod:`door.utilities` defines the utilities."""
 
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field, InitVar
 from enum import auto, Flag
 from functools import partial
+from inspect import iscoroutinefunction
 from multiprocessing import Value
 from multiprocessing.shared_memory import SharedMemory
 from pickle import dumps, loads
@@ -25,6 +26,8 @@ _T = TypeVar('_T')
 class Counter(Protocol):
     """The protocol for counters."""
 
+    __slots__ = ()
+
     def increment(self) -> None:
         """Increment.
 
@@ -46,8 +49,15 @@ class Counter(Protocol):
         """
         pass  # pragma: no cover
 
+    def __int__(self) -> int:
+        """Get the value.
 
-@dataclass
+        :return: The value.
+        """
+        pass  # pragma: no cover
+
+
+@dataclass(slots=True)
 class IntCounter(Counter):
     """The class for ``int`` counters.
 
@@ -65,12 +75,18 @@ class IntCounter(Counter):
     def __bool__(self) -> bool:
         return bool(self.__value)
 
+    def __int__(self) -> int:
+        return self.__value
 
-@dataclass
+
+@dataclass(slots=True)
 class ValueCounter(Counter):
     """The class for ``Value`` counters.
 
     This class is designed to be used for multiprocessing.
+
+    The value is allocated without its own lock, as the primitives only
+    update counters while holding their own lock.
     """
 
     __value: Any = field(
@@ -87,6 +103,9 @@ class ValueCounter(Counter):
     def __bool__(self) -> bool:
         return bool(self.__value.value)
 
+    def __int__(self) -> int:
+        return int(self.__value.value)
+
 
 @dataclass
 class Handle(Generic[_T]):
@@ -106,32 +125,70 @@ class Handle(Generic[_T]):
 
     NAME_MAX: ClassVar[int] = 255
     """The maximum size of the name."""
+    SIZE_SIZE: ClassVar[int] = 8
+    """The size of the data size prefix."""
     resource: InitVar[_T]
     """The shared resource."""
     __name: str = field(init=False)
+    __shm_name: SharedMemory | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    __shm_data: SharedMemory | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self, resource: _T) -> None:
         data = dumps(resource)
-        shm_data = SharedMemory(create=True, size=len(data))
-        shm_data.buf[:] = data
+        shm_data = SharedMemory(create=True, size=self.SIZE_SIZE + len(data))
+        self.__write(shm_data, data)
         shm_name = SharedMemory(create=True, size=self.NAME_MAX)
         shm_name.buf[:len(shm_data.name)] = shm_data.name.encode()
         self.__name = shm_name.name
+        self.__shm_name = shm_name
+        self.__shm_data = shm_data
 
-        shm_data.close()
-        shm_name.close()
+    @property
+    def name(self) -> str:
+        """The name of the handle, which is the same in every process."""
+        return self.__name
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {'_Handle__name': self.__name}
+
+    def __open(self) -> tuple[SharedMemory, SharedMemory]:
+        if self.__shm_name is None:
+            self.__shm_name = SharedMemory(self.__name)
+
+        shm_name = self.__shm_name
+        name = shm_name.buf.tobytes().rstrip(b'\0').decode()
+
+        if self.__shm_data is None or self.__shm_data.name != name:
+            if self.__shm_data is not None:
+                self.__shm_data.close()
+
+            self.__shm_data = SharedMemory(name)
+
+        return shm_name, self.__shm_data
+
+    def __write(self, shm_data: SharedMemory, data: bytes) -> None:
+        size = len(data)
+        shm_data.buf[:self.SIZE_SIZE] = size.to_bytes(self.SIZE_SIZE, 'little')
+        shm_data.buf[self.SIZE_SIZE:self.SIZE_SIZE + size] = data
 
     def get(self) -> _T:
         """Get the shared resource.
 
         :return: The shared resource.
         """
-        shm_name = SharedMemory(self.__name)
-        shm_data = SharedMemory(shm_name.buf.tobytes().rstrip(b'\0').decode())
-        data = shm_data.buf.tobytes()
-
-        shm_name.close()
-        shm_data.close()
+        _, shm_data = self.__open()
+        size = int.from_bytes(shm_data.buf[:self.SIZE_SIZE], 'little')
+        data = shm_data.buf[self.SIZE_SIZE:self.SIZE_SIZE + size].tobytes()
 
         return cast(_T, loads(data))
 
@@ -142,22 +199,20 @@ class Handle(Generic[_T]):
         :return: ``None``.
         """
         data = dumps(value)
-        shm_name = SharedMemory(self.__name)
-        shm_data = SharedMemory(shm_name.buf.tobytes().rstrip(b'\0').decode())
+        shm_name, shm_data = self.__open()
 
-        if shm_data.buf != data:
-            if len(shm_data.buf) != len(data):
-                shm_data.close()
-                shm_data.unlink()
+        size = self.SIZE_SIZE + len(data)
 
-                shm_data = SharedMemory(create=True, size=len(data))
-                shm_name.buf[:] = b'\0' * shm_name.size
-                shm_name.buf[:len(shm_data.name)] = shm_data.name.encode()
+        if len(shm_data.buf) < size:
+            shm_data.close()
+            shm_data.unlink()
 
-            shm_data.buf[:] = data
+            shm_data = SharedMemory(create=True, size=2 * size)
+            self.__shm_data = shm_data
+            shm_name.buf[:] = b'\0' * shm_name.size
+            shm_name.buf[:len(shm_data.name)] = shm_data.name.encode()
 
-        shm_name.close()
-        shm_data.close()
+        self.__write(shm_data, data)
 
     def unlink(self) -> None:
         """Unlink the shared resource.
@@ -166,8 +221,9 @@ class Handle(Generic[_T]):
 
         :return: ``None``.
         """
-        shm_name = SharedMemory(self.__name)
-        shm_data = SharedMemory(shm_name.buf.tobytes().rstrip(b'\0').decode())
+        shm_name, shm_data = self.__open()
+        self.__shm_name = None
+        self.__shm_data = None
 
         shm_name.close()
         shm_name.unlink()
@@ -241,7 +297,8 @@ class Proxy(Generic[_T]):
     __mode: Mode
     _resource: _T = field(init=False)
     __handle: Handle[_T] | None = field(init=False)
-    __status: bool = field(default=False, init=False)
+    __readable: bool = field(default=False, init=False)
+    __writable: bool = field(default=False, init=False)
 
     def __post_init__(self, resource_or_handle: _T | Handle[_T]) -> None:
         if isinstance(resource_or_handle, Handle):
@@ -264,34 +321,30 @@ class Proxy(Generic[_T]):
         if not self.__initialized:
             return self.__getattribute__(name)
 
-        try:
-            value = self.__getattribute__(name)
-        except AttributeError:
-            if not self.__status or self.Mode.READ not in self.__mode:
-                raise ValueError('no read permission')
+        # Only called after the normal lookup on the proxy has failed.
+        if not self.__readable:
+            raise ValueError('no read permission')
 
-            value = getattr(self._resource, name)
+        value = getattr(self._resource, name)
 
-            if isinstance(value, MethodType):
-                value = partial(value.__func__, self)
-            elif isinstance(value, BuiltinMethodType):
-                raise ValueError('builtin method type not supported')
+        if isinstance(value, MethodType):
+            value = MethodType(value.__func__, self)
+        elif isinstance(value, BuiltinMethodType):
+            raise ValueError('builtin method type not supported')
 
         return value
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if not self.__initialized:
+        if (
+                not self.__initialized
+                or name in self.__dict__
+                or hasattr(type(self), name)
+        ):
             super().__setattr__(name, value)
-
-        try:
-            self.__getattribute__(name)
-        except AttributeError:
-            if not self.__status or self.Mode.WRITE not in self.__mode:
-                raise ValueError('no write permission')
-
-            setattr(self._resource, name, value)
+        elif not self.__writable:
+            raise ValueError('no write permission')
         else:
-            super().__setattr__(name, value)
+            setattr(self._resource, name, value)
 
     def open(self) -> None:
         """Close.
@@ -301,23 +354,51 @@ class Proxy(Generic[_T]):
         if self.__handle is not None:
             self._resource = self.__handle.get()
 
-        self.__status = True
+        self.__readable = self.Mode.READ in self.__mode
+        self.__writable = self.Mode.WRITE in self.__mode
 
     def close(self) -> None:
         """Close.
 
         :return: ``None``.
         """
-        if self.__handle is not None and self.Mode.WRITE in self.__mode:
+        if self.__handle is not None and self.__writable:
             self.__handle.set(self._resource)
 
-        self.__status = False
+        self.__readable = False
+        self.__writable = False
 
 
 async def await_if_awaitable(awaitable: Any) -> None:
     """Await if awaitable.
 
+    ``None`` is checked first, as most synchronous primitives return
+    it, to skip the slower abstract base class check.
+
     :return: ``None``.
     """
-    if isinstance(awaitable, Awaitable):
+    if awaitable is not None and isinstance(awaitable, Awaitable):
         await awaitable
+
+
+def asyncify(function: Callable[[], Any]) -> Callable[[], Awaitable[None]]:
+    """Return the coroutine function equivalent of the function.
+
+    Coroutine functions are returned as is, so that awaiting their
+    results does not go through :func:`await_if_awaitable`. Other
+    functions are wrapped once, and their results are awaited only if
+    they are awaitable.
+
+    :param function: The function.
+    :return: The coroutine function.
+    """
+    if iscoroutinefunction(function):
+        return cast(Callable[[], Awaitable[None]], function)
+
+    async def wrapper() -> None:
+        result = function()
+
+        if result is not None and isinstance(result, Awaitable):
+            await result
+
+    return wrapper
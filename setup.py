@@ -35,4 +35,5 @@ setup(
     packages=find_packages(),
     python_requires='>=3.11',
     package_data={'door': ['py.typed']},
+    extras_require={'fast': ['uvloop']},
 )